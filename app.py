@@ -1,21 +1,42 @@
+import time
+_IMPORT_STARTED = time.perf_counter()  # Start of the "imports" phase in main()'s timing report
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputTextMessageContent, InlineQueryResultArticle, CallbackQuery
+from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, MessageHandler, ContextTypes, filters, InlineQueryHandler, CallbackQueryHandler
 import requests
 import os
 import json
+import re
 import random
 from datetime import datetime, timedelta
 import asyncio
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple
 from flask import Flask, request, Response
 import telegram
 import logging
 import threading
+import sys
+import atexit
+import signal
+
+_IMPORTS_DONE = time.perf_counter()
 
 # Configuration
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 OMDB_API_KEY = os.getenv('OMDB_API_KEY')
 TMDB_API_KEY = os.getenv('TMDB_API_KEY')  # Optional for enhanced features
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', 'cache_snapshot.json')  # Warm cache kept across restarts
+MOVIE_CACHE_SIZE = max(1, int(os.getenv('MOVIE_CACHE_SIZE', 10000)))
+SNAPSHOT_VERSION = 3  # Bump when Movie's slots or the snapshot layout change
+LIST_CACHE_TTL = max(0, int(os.getenv('LIST_CACHE_TTL', 6 * 3600)))  # Seconds to keep popular/genre lists
+RUN_MODE = os.getenv('RUN_MODE', 'webhook')  # 'webhook' or 'polling'
+LOOKUP_THREADS = max(1, int(os.getenv('LOOKUP_THREADS', 16)))  # Worker threads for blocking OMDB lookups, both modes
+POLL_CONCURRENCY = max(1, int(os.getenv('POLL_CONCURRENCY', 40)))  # Updates processed at once in polling mode, like webhook max_connections
+POLL_BATCH_SIZE = min(100, max(1, int(os.getenv('POLL_BATCH_SIZE', 100))))  # getUpdates limit, 1-100
+POLL_TIMEOUT = max(0, int(os.getenv('POLL_TIMEOUT', 30)))  # getUpdates long-poll timeout in seconds
 
 # Constants
 GENRES = {
@@ -26,21 +47,182 @@ GENRES = {
     'war': 10752, 'western': 37
 }
 
+def _omdb_value(data: Dict, key: str) -> Optional[str]:
+    """Return an OMDB field, treating 'N/A' and empty strings as missing"""
+    value = data.get(key)
+    if not value or value == 'N/A':
+        return None
+    return value
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else None
+
+def _parse_years(value: Optional[str]) -> tuple:
+    """Split an OMDB year into (start, end).
+
+    Series come back as ranges like "2008–2013", or "2008–" while still
+    running; end is None for a single year and 0 for an open range.
+    """
+    match = re.match(r"(\d{4})(?:[–-](\d{4})?)?", value or '')
+    if not match:
+        return None, None
+    start, end = match.group(1), match.group(2)
+    if match.group(0) == start:
+        return int(start), None
+    return int(start), int(end) if end else 0
+
+def _parse_runtime(value: Optional[str]) -> Optional[int]:
+    match = re.match(r"\d+", value or '')
+    return int(match.group()) if match else None
+
+def _parse_rating(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+class Movie:
+    """Compact movie record built from an OMDB response.
+
+    Only the fields the bot renders are kept. Genre and director strings are
+    interned since they repeat across many titles, and the full plot is left
+    empty until something asks for it (see MovieBot.load_full_plot).
+    """
+    __slots__ = ('imdb_id', 'title', 'year', 'end_year', 'genre', 'director', 'actors',
+                 'imdb_rating', 'runtime', 'poster', 'plot')
+
+    def __init__(self, imdb_id: str, title: str, year: Optional[int] = None,
+                 end_year: Optional[int] = None, genre: Optional[str] = None, director: Optional[str] = None,
+                 actors: Optional[str] = None, imdb_rating: Optional[float] = None,
+                 runtime: Optional[int] = None, poster: Optional[str] = None,
+                 plot: Optional[str] = None):
+        self.imdb_id = imdb_id
+        self.title = title
+        self.year = year
+        self.end_year = end_year  # Series only; 0 while still running
+        self.genre = _intern(genre)
+        self.director = _intern(director)
+        self.actors = actors
+        self.imdb_rating = imdb_rating
+        self.runtime = runtime
+        self.poster = poster
+        self.plot = plot
+
+    @classmethod
+    def from_omdb(cls, data: Dict) -> 'Movie':
+        """Build a record from an OMDB search result or detail response"""
+        year, end_year = _parse_years(data.get('Year'))
+        return cls(
+            imdb_id=data.get('imdbID', ''),
+            title=data.get('Title', 'Unknown'),
+            year=year,
+            end_year=end_year,
+            genre=_omdb_value(data, 'Genre'),
+            director=_omdb_value(data, 'Director'),
+            actors=_omdb_value(data, 'Actors'),
+            imdb_rating=_parse_rating(data.get('imdbRating')),
+            runtime=_parse_runtime(data.get('Runtime')),
+            poster=_omdb_value(data, 'Poster'),
+        )
+
+    @property
+    def genres(self) -> List[str]:
+        """Lowercased genre names, e.g. ['action', 'sci-fi']"""
+        if not self.genre:
+            return []
+        return [g.strip().lower() for g in self.genre.split(',')]
+
+    @property
+    def display_year(self) -> str:
+        """Year as OMDB shows it, e.g. 2010, 2008–2013 or 2019– for a running series"""
+        if not self.year:
+            return 'Unknown'
+        if self.end_year is None:
+            return str(self.year)
+        return f"{self.year}–{self.end_year or ''}"
+
+    def to_row(self) -> list:
+        """Serialize to a JSON-friendly list in __slots__ order"""
+        return [getattr(self, name) for name in self.__slots__]
+
+    @classmethod
+    def from_row(cls, row: list) -> 'Movie':
+        return cls(*row)
+
+    def __repr__(self):
+        return f"Movie({self.imdb_id!r}, {self.title!r}, {self.year!r})"
+
 class MovieBot:
     def __init__(self):
         self.user_preferences = {}  # Store user preferences in memory
+        self.movies: Dict[str, Movie] = {}  # Hot movie details by IMDb ID, least recently used first
+        # Both lists are stored as (cached_at, value) with a wall-clock time so
+        # their age survives a snapshot; see _is_fresh
+        self.popular_pool: Dict[str, Tuple[float, Movie]] = {}  # Top search hit per popular title
+        self.genre_index: Dict[str, Tuple[float, List[Movie]]] = {}  # Results of get_movies_by_genre
+        # Handlers run MovieBot calls in worker threads via asyncio.to_thread,
+        # so cache eviction and snapshotting are serialized
+        self._cache_lock = threading.Lock()
         
-    def get_movie_details(self, imdb_id: str) -> Optional[Dict]:
-        """Get detailed movie information from OMDB API"""
-        url = f"http://www.omdbapi.com/?apikey={OMDB_API_KEY}&i={imdb_id}&plot=full"
+    def _fetch_movie(self, imdb_id: str, full_plot: bool) -> Optional[Dict]:
+        """Fetch the raw OMDB detail response for an IMDb ID"""
+        plot = "full" if full_plot else "short"
+        url = f"http://www.omdbapi.com/?apikey={OMDB_API_KEY}&i={imdb_id}&plot={plot}"
         try:
             response = requests.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            if data.get("Response") == "False":
+                return None
+            return data
         except requests.RequestException:
             return None
+
+    def get_movie_details(self, imdb_id: str, full_plot: bool = False) -> Optional[Movie]:
+        """Get detailed movie information from OMDB API.
+
+        The plot is only fetched (and kept) when full_plot is set; otherwise
+        it's loaded on demand by load_full_plot.
+        """
+        with self._cache_lock:
+            movie = self.movies.pop(imdb_id, None)
+            if movie is not None:
+                # Re-insert so the dict stays in least-recently-used order
+                self.movies[imdb_id] = movie
+        if movie is not None:
+            if full_plot:
+                self.load_full_plot(movie)
+            return movie
+        data = self._fetch_movie(imdb_id, full_plot)
+        if data is None:
+            return None
+        movie = Movie.from_omdb(data)
+        if full_plot:
+            movie.plot = _omdb_value(data, 'Plot') or ''
+        self._cache_movie(movie)
+        return movie
+
+    def _cache_movie(self, movie: Movie) -> None:
+        with self._cache_lock:
+            if movie.imdb_id in self.movies:
+                # Another thread fetched the same title; just refresh its position
+                del self.movies[movie.imdb_id]
+            elif len(self.movies) >= MOVIE_CACHE_SIZE:
+                # Dicts keep insertion order, so this drops the least recently used entry
+                del self.movies[next(iter(self.movies))]
+            self.movies[movie.imdb_id] = movie
+
+    def load_full_plot(self, movie: Movie) -> str:
+        """Return the movie's full plot, fetching it the first time it's needed"""
+        if movie.plot is None:
+            data = self._fetch_movie(movie.imdb_id, full_plot=True)
+            if data is None:
+                # Leave the slot empty so a later call can retry
+                return ''
+            movie.plot = _omdb_value(data, 'Plot') or ''
+        return movie.plot
     
-    def search_movies(self, query: str, page: int = 1) -> List[Dict]:
+    def search_movies(self, query: str, page: int = 1) -> List[Movie]:
         """Search movies using OMDB API"""
         url = f"http://www.omdbapi.com/?apikey={OMDB_API_KEY}&s={query}&page={page}"
         try:
@@ -48,12 +230,12 @@ class MovieBot:
             response.raise_for_status()
             data = response.json()
             if data.get("Response") == "True":
-                return data.get("Search", [])
+                return [Movie.from_omdb(item) for item in data.get("Search", [])]
             return []
         except requests.RequestException:
             return []
     
-    def get_popular_movies(self) -> List[Dict]:
+    def get_popular_movies(self) -> List[Movie]:
         """Get popular movies (fallback list if TMDB not available)"""
         popular_movies = [
             "The Shawshank Redemption", "The Godfather", "The Dark Knight",
@@ -65,13 +247,24 @@ class MovieBot:
         ]
         
         results = []
-        for movie in random.sample(popular_movies, min(5, len(popular_movies))):
-            search_results = self.search_movies(movie)
-            if search_results:
-                results.append(search_results[0])
+        for title in random.sample(popular_movies, min(5, len(popular_movies))):
+            entry = self.popular_pool.get(title)
+            if self._is_fresh(entry):
+                movie = entry[1]
+            else:
+                search_results = self.search_movies(title)
+                if search_results:
+                    movie = search_results[0]
+                    self.popular_pool[title] = (time.time(), movie)
+                elif entry:
+                    # OMDB is failing; a stale hit beats no hit
+                    movie = entry[1]
+                else:
+                    continue
+            results.append(movie)
         return results
     
-    def get_movies_by_genre(self, genre: str) -> List[Dict]:
+    def get_movies_by_genre(self, genre: str) -> List[Movie]:
         """Search OMDB for movies by genre, fallback to hardcoded list if needed."""
         genre_searches = {
             'action': ['John Wick', 'Mad Max: Fury Road', 'Die Hard', 'Terminator 2', 'Mission Impossible'],
@@ -94,24 +287,24 @@ class MovieBot:
             'western': ['The Good, the Bad and the Ugly', 'Django Unchained', 'Unforgiven', 'True Grit', 'No Country for Old Men']
         }
         genre_key = genre.lower()
+        entry = self.genre_index.get(genre_key)
+        if self._is_fresh(entry):
+            return entry[1]
         # Step 1: Try OMDB search and filter by genre
         search_results = self.search_movies(genre)
         filtered = []
         for movie in search_results:
-            imdb_id = movie.get('imdbID')
-            if imdb_id:
-                details = self.get_movie_details(imdb_id)
-                if details and 'Genre' in details:
-                    genres = [g.strip().lower() for g in details['Genre'].split(',')]
-                    if genre_key in genres:
-                        filtered.append(movie)
+            if movie.imdb_id:
+                details = self.get_movie_details(movie.imdb_id)
+                if details and genre_key in details.genres:
+                    filtered.append(details)
             if len(filtered) >= 3:
                 break
         # Step 2: If not enough, fill from hardcoded list
         if len(filtered) < 3 and genre_key in genre_searches:
             needed = 3 - len(filtered)
             # Avoid duplicates
-            already_titles = {m.get('Title') for m in filtered}
+            already_titles = {m.title for m in filtered}
             for title in genre_searches[genre_key]:
                 if title not in already_titles:
                     search = self.search_movies(title)
@@ -119,21 +312,90 @@ class MovieBot:
                         filtered.append(search[0])
                         if len(filtered) >= 3:
                             break
+        # A short list means some lookups failed; don't keep it around
+        if len(filtered) >= 3:
+            self.genre_index[genre_key] = (time.time(), filtered)
         return filtered
+
+    @staticmethod
+    def _is_fresh(entry: Optional[tuple]) -> bool:
+        return entry is not None and time.time() - entry[0] < LIST_CACHE_TTL
+
+    def _snapshot_ref(self, movie: Movie):
+        # Records shared with self.movies are stored once, by IMDb ID
+        if self.movies.get(movie.imdb_id) is movie:
+            return movie.imdb_id
+        return movie.to_row()
+
+    @staticmethod
+    def _resolve_ref(ref, movies: Dict[str, Movie]) -> Optional[Movie]:
+        if isinstance(ref, str):
+            return movies.get(ref)
+        return Movie.from_row(ref)
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the hot movies, popular pool and genre index to a JSON file"""
+        with self._cache_lock:
+            snapshot = {
+                'version': SNAPSHOT_VERSION,
+                'movies': [movie.to_row() for movie in self.movies.values()],
+                'popular': {title: [cached_at, self._snapshot_ref(movie)]
+                            for title, (cached_at, movie) in list(self.popular_pool.items())},
+                'genres': {genre: [cached_at, [self._snapshot_ref(movie) for movie in movies]]
+                           for genre, (cached_at, movies) in list(self.genre_index.items())},
+            }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def load_snapshot(self, path: str) -> int:
+        """Warm the caches from a snapshot file, returning how many movies were loaded.
+
+        A missing, unreadable or outdated snapshot just means a cold start.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('version') != SNAPSHOT_VERSION:
+                print(f"⚠️ Ignoring snapshot {path} from another version")
+                return 0
+            movies = [Movie.from_row(row) for row in snapshot.get('movies', [])][-MOVIE_CACHE_SIZE:]
+            by_id = {movie.imdb_id: movie for movie in movies}
+            # Expired lists are dropped rather than carried into another deploy
+            popular = {title: (cached_at, self._resolve_ref(ref, by_id))
+                       for title, (cached_at, ref) in snapshot.get('popular', {}).items()
+                       if self._is_fresh((cached_at, ref))}
+            genres = {genre: (cached_at, [self._resolve_ref(ref, by_id) for ref in refs])
+                      for genre, (cached_at, refs) in snapshot.get('genres', {}).items()
+                      if self._is_fresh((cached_at, refs))}
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            # AttributeError/TypeError: valid JSON in the wrong shape
+            print(f"⚠️ Ignoring unreadable snapshot {path}: {e}")
+            return 0
+        for movie in movies:
+            self._cache_movie(movie)
+        # IDs that fell out of the movie cache are simply dropped
+        self.popular_pool.update((title, entry) for title, entry in popular.items() if entry[1])
+        self.genre_index.update((genre, (cached_at, [movie for movie in movies if movie]))
+                                for genre, (cached_at, movies) in genres.items())
+        return len(movies)
     
-    def format_movie_info(self, movie_data: Dict) -> str:
+    def format_movie_info(self, movie: Optional[Movie]) -> str:
         """Format movie information for display"""
-        if not movie_data or movie_data.get("Response") == "False":
+        if not movie:
             return "❌ Movie information not available"
         
-        title = movie_data.get('Title', 'N/A')
-        year = movie_data.get('Year', 'N/A')
-        director = movie_data.get('Director', 'N/A')
-        genre = movie_data.get('Genre', 'N/A')
-        imdb_rating = movie_data.get('imdbRating', 'N/A')
-        runtime = movie_data.get('Runtime', 'N/A')
-        plot = movie_data.get('Plot', 'N/A')
-        actors = movie_data.get('Actors', 'N/A')
+        title = movie.title
+        year = movie.display_year if movie.year else 'N/A'
+        director = movie.director or 'N/A'
+        genre = movie.genre or 'N/A'
+        imdb_rating = movie.imdb_rating if movie.imdb_rating is not None else 'N/A'
+        runtime = f"{movie.runtime} min" if movie.runtime else 'N/A'
+        plot = movie.plot or 'N/A'
+        actors = movie.actors or 'N/A'
         
         # Truncate plot if too long
         if len(plot) > 300:
@@ -260,7 +522,7 @@ async def popular_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Popular movies command handler"""
     await update.message.reply_text("🔥 *Getting popular movies...*", parse_mode='Markdown')
     
-    popular_movies = movie_bot.get_popular_movies()
+    popular_movies = await asyncio.to_thread(movie_bot.get_popular_movies)
     
     if not popular_movies:
         await update.message.reply_text("❌ Unable to fetch popular movies. Please try again later.")
@@ -269,9 +531,9 @@ async def popular_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("🔥 *Popular Movies:*", parse_mode='Markdown')
     
     for movie in popular_movies:
-        title = movie.get('Title', 'Unknown')
-        year = movie.get('Year', 'Unknown')
-        imdb_id = movie.get('imdbID', '')
+        title = movie.title
+        year = movie.display_year
+        imdb_id = movie.imdb_id
         
         if imdb_id:
             keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -285,19 +547,19 @@ async def random_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Random movie command handler"""
     await update.message.reply_text("🎲 *Finding a random movie for you...*", parse_mode='Markdown')
     
-    popular_movies = movie_bot.get_popular_movies()
+    popular_movies = await asyncio.to_thread(movie_bot.get_popular_movies)
     
     if not popular_movies:
         await update.message.reply_text("❌ Unable to get random movie. Please try again later.")
         return
     
     random_movie = random.choice(popular_movies)
-    title = random_movie.get('Title', 'Unknown')
-    year = random_movie.get('Year', 'Unknown')
-    imdb_id = random_movie.get('imdbID', '')
+    title = random_movie.title
+    year = random_movie.display_year
+    imdb_id = random_movie.imdb_id
     
     if imdb_id:
-        movie_details = movie_bot.get_movie_details(imdb_id)
+        movie_details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id, full_plot=True)
         if movie_details:
             formatted_info = movie_bot.format_movie_info(movie_details)
             keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -324,10 +586,10 @@ async def watchlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(f"📋 *Your Watchlist ({len(watchlist)} movies):*", parse_mode='Markdown')
     
     for imdb_id in watchlist:
-        movie_details = movie_bot.get_movie_details(imdb_id)
+        movie_details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id)
         if movie_details:
-            title = movie_details.get('Title', 'Unknown')
-            year = movie_details.get('Year', 'Unknown')
+            title = movie_details.title
+            year = movie_details.display_year
             keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
             
             await update.message.reply_text(
@@ -364,7 +626,7 @@ async def process_search(update, query: str):
     """Process movie search"""
     await update.message.reply_text(f"🔍 *Searching for '{query}'...*", parse_mode='Markdown')
     
-    movies = movie_bot.search_movies(query)
+    movies = await asyncio.to_thread(movie_bot.search_movies, query)
     
     if not movies:
         await update.message.reply_text(
@@ -377,9 +639,9 @@ async def process_search(update, query: str):
     
     # Show top 5 results
     for movie in movies[:5]:
-        title = movie.get('Title', 'Unknown')
-        year = movie.get('Year', 'Unknown')
-        imdb_id = movie.get('imdbID', '')
+        title = movie.title
+        year = movie.display_year
+        imdb_id = movie.imdb_id
         
         if imdb_id:
             keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -419,7 +681,7 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
     elif data == "popular_movies":
         await query.edit_message_text("🔥 *Getting popular movies...*", parse_mode='Markdown')
         
-        popular_movies = movie_bot.get_popular_movies()
+        popular_movies = await asyncio.to_thread(movie_bot.get_popular_movies)
         
         if popular_movies:
             await query.edit_message_text(
@@ -429,9 +691,9 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
             )
             
             for movie in popular_movies:
-                title = movie.get('Title', 'Unknown')
-                year = movie.get('Year', 'Unknown')
-                imdb_id = movie.get('imdbID', '')
+                title = movie.title
+                year = movie.display_year
+                imdb_id = movie.imdb_id
                 
                 if imdb_id:
                     keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -459,7 +721,7 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
         genre = data.split("_")[1]
         await query.edit_message_text(f"🎭 *Getting {genre.capitalize()} movies...*", parse_mode='Markdown')
         
-        genre_movies = movie_bot.get_movies_by_genre(genre)
+        genre_movies = await asyncio.to_thread(movie_bot.get_movies_by_genre, genre)
         
         if genre_movies:
             await query.edit_message_text(
@@ -469,9 +731,9 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
             )
             
             for movie in genre_movies:
-                title = movie.get('Title', 'Unknown')
-                year = movie.get('Year', 'Unknown')
-                imdb_id = movie.get('imdbID', '')
+                title = movie.title
+                year = movie.display_year
+                imdb_id = movie.imdb_id
                 
                 if imdb_id:
                     keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -491,16 +753,16 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
     elif data == "random_movie":
         await query.edit_message_text("🎲 *Finding a random movie for you...*", parse_mode='Markdown')
         
-        popular_movies = movie_bot.get_popular_movies()
+        popular_movies = await asyncio.to_thread(movie_bot.get_popular_movies)
         
         if popular_movies:
             random_movie = random.choice(popular_movies)
-            title = random_movie.get('Title', 'Unknown')
-            year = random_movie.get('Year', 'Unknown')
-            imdb_id = random_movie.get('imdbID', '')
+            title = random_movie.title
+            year = random_movie.display_year
+            imdb_id = random_movie.imdb_id
             
             if imdb_id:
-                movie_details = movie_bot.get_movie_details(imdb_id)
+                movie_details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id, full_plot=True)
                 if movie_details:
                     formatted_info = movie_bot.format_movie_info(movie_details)
                     keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
@@ -537,10 +799,10 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
             )
             
             for imdb_id in watchlist:
-                movie_details = movie_bot.get_movie_details(imdb_id)
+                movie_details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id)
                 if movie_details:
-                    title = movie_details.get('Title', 'Unknown')
-                    year = movie_details.get('Year', 'Unknown')
+                    title = movie_details.title
+                    year = movie_details.display_year
                     keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
                     
                     await context.bot.send_message(
@@ -568,11 +830,11 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
     
     elif data.startswith("details_"):
         imdb_id = data.split("_")[1]
-        movie_details = movie_bot.get_movie_details(imdb_id)
+        movie_details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id, full_plot=True)
         
         if movie_details:
             formatted_info = movie_bot.format_movie_info(movie_details)
-            title = movie_details.get('Title', 'Unknown')
+            title = movie_details.title
             keyboard = movie_bot.create_movie_keyboard(imdb_id, title)
             
             await query.edit_message_text(
@@ -594,10 +856,10 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
 
 # Helper: Send movie info (short)
 async def send_movie_info(update, movie):
-    imdb_id = movie['imdbID']
-    title = movie['Title']
-    year = movie['Year']
-    poster = movie.get('Poster')
+    imdb_id = movie.imdb_id
+    title = movie.title
+    year = movie.display_year
+    poster = movie.poster
     url = f"https://www.imdb.com/title/{imdb_id}/"
     keyboard = [[
         InlineKeyboardButton("🎬 IMDb Page", url=url),
@@ -607,7 +869,7 @@ async def send_movie_info(update, movie):
     ]]
     reply_markup = InlineKeyboardMarkup(keyboard)
     text = f"🎬 *{title}* ({year})\n[IMDb Page]({url})"
-    if poster and poster != 'N/A':
+    if poster:
         await update.message.reply_photo(photo=poster, caption=text, reply_markup=reply_markup, parse_mode='Markdown')
     else:
         await update.message.reply_text(text, reply_markup=reply_markup, parse_mode='Markdown')
@@ -620,7 +882,7 @@ async def add_to_watchlist_callback(update: Update, context: ContextTypes.DEFAUL
     if data.startswith("addfav:"):
         imdb_id = data.split(":", 1)[1]
         user_id = query.from_user.id
-        details = movie_bot.get_movie_details(imdb_id)
+        details = await asyncio.to_thread(movie_bot.get_movie_details, imdb_id)
         if not details:
             await query.edit_message_reply_markup(reply_markup=None)
             await query.message.reply_text("❌ No details found for that IMDb ID.")
@@ -632,24 +894,126 @@ async def add_to_watchlist_callback(update: Update, context: ContextTypes.DEFAUL
             user_favs.add(imdb_id)
             await query.answer("Added to your watchlist! ⭐", show_alert=True)
 
-# Create a single event loop for the whole app
-loop = asyncio.new_event_loop()
+class StartupTimer:
+    """Records how long each startup phase takes so slow boots are easy to spot"""
 
-def run_loop(loop):
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.phases = []
 
-# Main function
-def main():
-    """Main function to run the bot"""
-    if not TELEGRAM_TOKEN:
-        print("❌ TELEGRAM_TOKEN not found. Please set it in environment variables.")
-        return
-    
-    if not OMDB_API_KEY:
-        print("❌ OMDB_API_KEY not found. Please set it in environment variables.")
-        return
+    @contextmanager
+    def phase(self, name: str):
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - phase_start))
 
+    def report(self) -> str:
+        # Phases marked (bg) run on another thread and overlap the others
+        lines = ["⏱️ Startup timings:"]
+        for name, seconds in self.phases:
+            lines.append(f"   {name:<22}{seconds * 1000:9.1f} ms")
+        total = time.perf_counter() - self.started
+        lines.append(f"   {'total':<22}{total * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+def save_snapshot_on_exit():
+    try:
+        movie_bot.save_snapshot(SNAPSHOT_PATH)
+        print(f"💾 Saved cache snapshot ({len(movie_bot.movies)} movies) to {SNAPSHOT_PATH}")
+    except (OSError, RuntimeError) as e:
+        print(f"⚠️ Could not save cache snapshot: {e}")
+
+class ChatOrderedDispatcher:
+    """Processes updates concurrently while keeping each chat's updates in order.
+
+    Every update is chained behind the previous update from the same chat, and
+    at most `concurrency` updates run at once across all chats.
+    """
+
+    def __init__(self, application, concurrency: int):
+        self.application = application
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tails: Dict[tuple, asyncio.Task] = {}  # Last submitted task per chat
+        self.pending = set()
+
+    @staticmethod
+    def _chat_key(update) -> tuple:
+        if update.effective_chat:
+            return ('chat', update.effective_chat.id)
+        if update.effective_user:
+            return ('user', update.effective_user.id)
+        # Nothing to order against (e.g. poll updates), so run it on its own
+        return ('update', update.update_id)
+
+    def submit(self, update) -> asyncio.Task:
+        key = self._chat_key(update)
+        task = asyncio.create_task(self._process(update, self._tails.get(key)))
+        self._tails[key] = task
+        self.pending.add(task)
+        task.add_done_callback(lambda t: self._done(key, t))
+        return task
+
+    def _done(self, key: tuple, task: asyncio.Task) -> None:
+        self.pending.discard(task)
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+    async def _process(self, update, previous: Optional[asyncio.Task]) -> None:
+        if previous is not None:
+            # asyncio.wait doesn't re-raise the previous update's failure
+            await asyncio.wait([previous])
+        async with self._semaphore:
+            try:
+                await self.application.process_update(update)
+            except Exception as e:
+                print("Update error:", e)
+
+    async def wait_below(self, limit: int) -> None:
+        """Wait until fewer than `limit` updates are in flight"""
+        while len(self.pending) >= limit:
+            await asyncio.wait(self.pending, return_when=asyncio.FIRST_COMPLETED)
+
+    async def drain(self) -> None:
+        if self.pending:
+            await asyncio.wait(self.pending)
+
+async def poll_updates(application, concurrency: int = POLL_CONCURRENCY,
+                       batch_size: int = POLL_BATCH_SIZE, timeout: int = POLL_TIMEOUT):
+    """Long-poll getUpdates and hand each batch to a ChatOrderedDispatcher.
+
+    Runs until cancelled; updates already fetched are finished and then
+    confirmed to Telegram before returning, so they aren't redelivered.
+    """
+    dispatcher = ChatOrderedDispatcher(application, concurrency)
+    offset = None
+    try:
+        while True:
+            # Don't fetch more than one batch ahead of what's being processed
+            await dispatcher.wait_below(batch_size)
+            try:
+                updates = await application.bot.get_updates(offset=offset, limit=batch_size, timeout=timeout)
+            except TelegramError as e:
+                print("Polling error:", e)
+                await asyncio.sleep(1)
+                continue
+            for update in updates:
+                dispatcher.submit(update)
+            if updates:
+                offset = updates[-1].update_id + 1
+    finally:
+        await dispatcher.drain()
+        if offset is not None:
+            # Telegram only forgets a batch once it sees a higher offset, as in
+            # PTB's Updater.stop()
+            try:
+                await application.bot.get_updates(offset=offset, limit=1, timeout=0)
+            except TelegramError as e:
+                print("Could not confirm processed updates:", e)
+
+def build_application():
+    """Create the telegram Application with all of the bot's handlers registered"""
     application = Application.builder().token(TELEGRAM_TOKEN).build()
 
     # Command handlers
@@ -665,14 +1029,16 @@ def main():
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
     application.add_handler(CallbackQueryHandler(handle_callback_query))
     application.add_handler(CallbackQueryHandler(add_to_watchlist_callback, pattern=r"^addfav:"))
+    return application
 
-    # Flask app for webhook
+def create_flask_app(application):
+    """Create the Flask app that feeds webhook updates into the global event loop"""
     flask_app = Flask(__name__)
 
     @flask_app.route(f"/webhook/{TELEGRAM_TOKEN}", methods=["POST"])
     def webhook():
         if request.method == "POST":
-            update = telegram.Update.de_json(request.get_json(force=True), application.bot)
+            update = Update.de_json(request.get_json(force=True), application.bot)
             try:
                 # Schedule the coroutine in the global event loop
                 future = asyncio.run_coroutine_threadsafe(application.process_update(update), loop)
@@ -689,13 +1055,92 @@ def main():
     def health():
         return "CineBot is running! Use the Telegram bot to interact.", 200
 
-    # Set webhook and initialize application
-    WEBHOOK_URL = os.environ.get('WEBHOOK_URL', 'https://telegrambot-53po.onrender.com')
+    return flask_app
+
+# Create a single event loop for the whole app
+loop = asyncio.new_event_loop()
+
+def run_loop(loop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+# Main function
+def main():
+    """Main function to run the bot"""
+    timer = StartupTimer(started=_IMPORT_STARTED)
+    timer.phases.append(("imports", _IMPORTS_DONE - _IMPORT_STARTED))
+
+    if not TELEGRAM_TOKEN:
+        print("❌ TELEGRAM_TOKEN not found. Please set it in environment variables.")
+        return
+    
+    if not OMDB_API_KEY:
+        print("❌ OMDB_API_KEY not found. Please set it in environment variables.")
+        return
+
+    # Read the cache snapshot in the background while the Telegram handshake
+    # below is running
+    snapshot_stats = {}
+    def load_snapshot():
+        load_start = time.perf_counter()
+        with timer.phase("snapshot load (bg)"):
+            snapshot_stats['movies'] = movie_bot.load_snapshot(SNAPSHOT_PATH)
+        snapshot_stats['seconds'] = time.perf_counter() - load_start
+    snapshot_thread = threading.Thread(target=load_snapshot, daemon=True)
+    snapshot_thread.start()
+
+    with timer.phase("build application"):
+        application = build_application()
+
+    if RUN_MODE == 'polling':
+        # getUpdates is refused while a webhook is set
+        webhook_url = ''
+    else:
+        flask_app = create_flask_app(application)
+        WEBHOOK_URL = os.environ.get('WEBHOOK_URL', 'https://telegrambot-53po.onrender.com')
+        webhook_url = f"{WEBHOOK_URL}/webhook/{TELEGRAM_TOKEN}"
+
+    # Initialize application and only touch the webhook if Telegram's differs
     async def setup():
-        await application.initialize()
-        await application.bot.set_webhook(url=f"{WEBHOOK_URL}/webhook/{TELEGRAM_TOKEN}")
+        with timer.phase("initialize"):
+            await application.initialize()
+        with timer.phase("webhook"):
+            info = await application.bot.get_webhook_info()
+            if info.url != webhook_url:
+                if webhook_url:
+                    await application.bot.set_webhook(url=webhook_url)
+                else:
+                    await application.bot.delete_webhook()
     loop.run_until_complete(setup())
 
+    with timer.phase("snapshot (wait)"):
+        snapshot_thread.join()
+    print(f"📦 Loaded {snapshot_stats.get('movies', 0)} cached movies, {len(movie_bot.popular_pool)} popular titles "
+          f"and {len(movie_bot.genre_index)} genres in {snapshot_stats.get('seconds', 0.0) * 1000:.1f} ms")
+    print(timer.report())
+
+    # Persist the warm caches for the next deploy
+    atexit.register(save_snapshot_on_exit)
+
+    # Handlers run their OMDB lookups via asyncio.to_thread, i.e. in the loop's
+    # default executor; size it explicitly so both run modes get the same pool
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=LOOKUP_THREADS))
+
+    if RUN_MODE == 'polling':
+        print(f"🎬 CineBot is running with long polling (concurrency {POLL_CONCURRENCY})...")
+        poller = loop.create_task(poll_updates(application))
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, poller.cancel)
+        try:
+            loop.run_until_complete(poller)
+        except asyncio.CancelledError:
+            pass
+        loop.run_until_complete(application.shutdown())
+        return
+
+    # Turn SIGTERM into a normal exit so the atexit hook runs
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     print("🎬 CineBot is running with Flask webhook server...")
     print("# For production, consider using a WSGI server like gunicorn or waitress instead of Flask's built-in server.")
 
@@ -704,4 +1149,4 @@ def main():
     flask_app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 10000)))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,109 @@
+"""Memory benchmark: raw OMDB detail dicts vs. compact Movie records.
+
+Builds N synthetic `plot=full` OMDB responses (default 100k) and measures how
+much memory stays allocated when they are cached as-is versus converted to
+Movie records. No network access or API keys are needed.
+
+    python benchmarks/movie_memory.py [--count 100000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import Movie  # noqa: E402
+
+GENRE_POOL = [
+    "Action, Adventure, Sci-Fi", "Crime, Drama", "Comedy", "Drama, Romance",
+    "Horror, Mystery, Thriller", "Animation, Adventure, Comedy", "Biography, Drama, History",
+    "Documentary", "Fantasy, Family", "War, Drama", "Western",
+]
+WORDS = ("the a man woman city war love secret night family journey past "
+         "world years finds must against time lost young old home").split()
+
+
+def fake_omdb_response(i: int, rng: random.Random) -> dict:
+    """Return a dict shaped like an OMDB `i=...&plot=full` response"""
+    plot = " ".join(rng.choice(WORDS) for _ in range(rng.randint(80, 160))).capitalize() + "."
+    return {
+        "Title": f"Movie {i}",
+        "Year": str(rng.randint(1920, 2024)),
+        "Rated": rng.choice(["G", "PG", "PG-13", "R", "N/A"]),
+        "Released": f"{rng.randint(1, 28):02d} Jan {rng.randint(1920, 2024)}",
+        "Runtime": f"{rng.randint(70, 200)} min",
+        "Genre": rng.choice(GENRE_POOL),
+        "Director": f"Director {rng.randint(1, 5000)}",
+        "Writer": f"Writer {rng.randint(1, 8000)}, Writer {rng.randint(1, 8000)}",
+        "Actors": ", ".join(f"Actor {rng.randint(1, 20000)}" for _ in range(3)),
+        "Plot": plot,
+        "Language": "English, French",
+        "Country": "United States, United Kingdom",
+        "Awards": f"Won {rng.randint(0, 5)} Oscars. {rng.randint(0, 100)} wins & {rng.randint(0, 200)} nominations total",
+        "Poster": f"https://m.media-amazon.com/images/M/MV5B{i:012d}_V1_SX300.jpg",
+        "Ratings": [
+            {"Source": "Internet Movie Database", "Value": f"{rng.uniform(1, 10):.1f}/10"},
+            {"Source": "Rotten Tomatoes", "Value": f"{rng.randint(0, 100)}%"},
+            {"Source": "Metacritic", "Value": f"{rng.randint(0, 100)}/100"},
+        ],
+        "Metascore": str(rng.randint(0, 100)),
+        "imdbRating": f"{rng.uniform(1, 10):.1f}",
+        "imdbVotes": f"{rng.randint(1, 2_000_000):,}",
+        "imdbID": f"tt{i:07d}",
+        "Type": "movie",
+        "DVD": "N/A",
+        "BoxOffice": f"${rng.randint(1, 900_000_000):,}",
+        "Production": "N/A",
+        "Website": "N/A",
+        "Response": "True",
+    }
+
+
+def measure(build, payloads):
+    """Return bytes still allocated after building a cache from payloads"""
+    tracemalloc.start()
+    cache = build(payloads)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # Keep the payloads as JSON text so every run decodes fresh strings,
+    # just like responses coming off the wire
+    payloads = [json.dumps(fake_omdb_response(i, rng)) for i in range(args.count)]
+
+    raw = measure(lambda p: {m["imdbID"]: m for m in map(json.loads, p)}, payloads)
+    compact = measure(lambda p: {m.imdb_id: m for m in (Movie.from_omdb(json.loads(t)) for t in p)}, payloads)
+
+    def with_plot(p):
+        cache = {}
+        for text in p:
+            data = json.loads(text)
+            movie = Movie.from_omdb(data)
+            movie.plot = data["Plot"]
+            cache[movie.imdb_id] = movie
+        return cache
+
+    compact_plot = measure(with_plot, payloads)
+
+    print(f"Cached titles: {args.count:,}")
+    print(f"{'':<28}{'total MiB':>12}{'bytes/record':>15}")
+    for label, size in (("raw OMDB dict", raw),
+                        ("Movie (plot not loaded)", compact),
+                        ("Movie (full plot loaded)", compact_plot)):
+        print(f"{label:<28}{size / 2**20:>12.1f}{size / args.count:>15.0f}")
+    print(f"Reduction (plot not loaded): {raw / compact:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
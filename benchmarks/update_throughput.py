@@ -0,0 +1,136 @@
+"""Throughput benchmark: webhook mode vs. long-polling mode.
+
+Feeds the same stream of synthetic updates through both run modes and reports
+updates per second. Each update simulates a handler: a blocking OMDB lookup
+run via asyncio.to_thread (as the real handlers do) followed by an awaited
+Telegram reply. No network access or API keys are needed.
+
+Webhook mode mirrors the Flask route in app.py: every request thread blocks on
+run_coroutine_threadsafe(...).result(), with up to --connections requests in
+flight (Telegram's default webhook max_connections is 40). HTTP overhead is
+not included. Polling mode runs app.poll_updates against a fake bot. Both
+modes get a --threads sized executor for the lookups, like LOOKUP_THREADS in
+app.py.
+
+    python benchmarks/update_throughput.py [--updates 2000] [--chats 200]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import poll_updates  # noqa: E402
+
+
+def make_updates(count: int, chats: int, rng: random.Random) -> list:
+    updates = []
+    for update_id in range(1, count + 1):
+        chat = SimpleNamespace(id=rng.randrange(chats))
+        updates.append(SimpleNamespace(update_id=update_id, effective_chat=chat, effective_user=None))
+    return updates
+
+
+class FakeApplication:
+    """Stands in for telegram.ext.Application, recording per-chat completion order"""
+
+    def __init__(self, updates: list, lookup_latency: float, reply_latency: float, rtt: float):
+        self.bot = SimpleNamespace(get_updates=self.get_updates)
+        self._queue = list(updates)
+        self._total = len(updates)
+        self.lookup_latency = lookup_latency
+        self.reply_latency = reply_latency
+        self.rtt = rtt
+        self.order = defaultdict(list)
+        self.finished = None  # asyncio.Event, created on the running loop
+
+    async def get_updates(self, offset=None, limit=100, timeout=0):
+        await asyncio.sleep(self.rtt)
+        batch, self._queue = self._queue[:limit], self._queue[limit:]
+        if not batch:
+            await asyncio.sleep(0.05)  # Nothing left; pretend the long poll is waiting
+        return batch
+
+    async def process_update(self, update):
+        await asyncio.to_thread(time.sleep, self.lookup_latency)
+        await asyncio.sleep(self.reply_latency)
+        self.order[update.effective_chat.id].append(update.update_id)
+        if sum(map(len, self.order.values())) == self._total:
+            self.finished.set()
+
+    def ordered(self) -> bool:
+        return all(ids == sorted(ids) for ids in self.order.values())
+
+
+def run_webhook(updates, args) -> tuple:
+    app = FakeApplication(updates, args.lookup, args.reply, args.rtt)
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=args.threads))
+    loop.call_soon_threadsafe(lambda: setattr(app, 'finished', asyncio.Event()))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+    def handle_request(update):
+        asyncio.run_coroutine_threadsafe(app.process_update(update), loop).result()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.connections) as pool:
+        list(pool.map(handle_request, updates))
+    elapsed = time.perf_counter() - start
+    loop.call_soon_threadsafe(loop.stop)
+    return elapsed, app.ordered()
+
+
+def run_polling(updates, args) -> tuple:
+    app = FakeApplication(updates, args.lookup, args.reply, args.rtt)
+
+    async def bench():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=args.threads))
+        app.finished = asyncio.Event()
+        start = time.perf_counter()
+        poller = asyncio.create_task(poll_updates(app, concurrency=args.concurrency, batch_size=args.batch))
+        await app.finished.wait()
+        elapsed = time.perf_counter() - start
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+        return elapsed
+
+    elapsed = asyncio.run(bench())
+    return elapsed, app.ordered()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--chats", type=int, default=200)
+    parser.add_argument("--lookup", type=float, default=0.08, help="blocking OMDB lookup per update (s)")
+    parser.add_argument("--reply", type=float, default=0.03, help="awaited Telegram reply per update (s)")
+    parser.add_argument("--rtt", type=float, default=0.05, help="getUpdates round trip (s)")
+    parser.add_argument("--threads", type=int, default=16, help="lookup executor size, both modes")
+    parser.add_argument("--connections", type=int, default=40, help="webhook max_connections")
+    parser.add_argument("--concurrency", type=int, default=40, help="polling concurrency limit")
+    parser.add_argument("--batch", type=int, default=100, help="getUpdates batch size")
+    args = parser.parse_args()
+
+    updates = make_updates(args.updates, args.chats, random.Random(0))
+    print(f"{args.updates:,} updates across {args.chats} chats, "
+          f"{args.lookup * 1000:.0f} ms lookup + {args.reply * 1000:.0f} ms reply each, "
+          f"{args.threads} lookup threads")
+    print(f"{'mode':<32}{'seconds':>10}{'updates/s':>12}{'in order':>12}")
+    for label, runner in ((f"webhook ({args.connections} connections)", run_webhook),
+                          (f"polling (concurrency {args.concurrency})", run_polling)):
+        elapsed, ordered = runner(updates, args)
+        print(f"{label:<32}{elapsed:>10.2f}{args.updates / elapsed:>12.1f}{'yes' if ordered else 'no':>12}")
+
+
+if __name__ == "__main__":
+    main()